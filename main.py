@@ -19,25 +19,132 @@ questions_folder/
     └── ...
 """
 
+import importlib.util
+import io
+import json
+import logging
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import List, Tuple, Optional
+from typing import TYPE_CHECKING, Dict, Iterator, List, Tuple, Optional
 
-try:
-    from reportlab.pdfgen import canvas
-    from reportlab.lib.pagesizes import A4
-    from reportlab.lib.utils import ImageReader
-    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Image, PageBreak
-    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-    from reportlab.lib.units import inch, cm
-    from reportlab.lib import colors
+if TYPE_CHECKING:
     from PIL import Image as PILImage
-except ImportError as e:
+    from reportlab.lib.utils import ImageReader
+    from reportlab.platypus import Image
+
+# ReportLab and Pillow are imported where they are used, so pool workers only
+# load Pillow and the heavy platypus modules are skipped when they aren't needed
+if importlib.util.find_spec("reportlab") is None or importlib.util.find_spec("PIL") is None:
     print(f"Missing required packages. Please install with:")
     print("pip install reportlab pillow")
     sys.exit(1)
 
+logger = logging.getLogger(__name__)
+
+
+def _is_grayscale(img: 'PILImage.Image') -> bool:
+    """
+    Check whether an image only uses gray colors.
+    
+    Args:
+        img: Opened PIL image
+        
+    Returns:
+        True if every pixel has equal red, green and blue values
+    """
+    if img.mode in ('1', 'L'):
+        return True
+    if img.mode != 'P':
+        return False
+        
+    palette = img.getpalette()
+    if palette is None:
+        return False
+        
+    # getcolors() on a palette image lists the palette indices actually in use
+    return all(palette[3 * index] == palette[3 * index + 1] == palette[3 * index + 2]
+               for _, index in img.getcolors(256))
+
+
+def _decode_image(image_path: str, max_size: Optional[Tuple[int, int]] = None) -> 'PILImage.Image':
+    """
+    Open an image file and decode it to RGB pixels, or to grayscale pixels if it has no color.
+    
+    Grayscale images are embedded as DeviceGray with one byte per pixel
+    instead of three, which cuts the data ReportLab has to compress.
+    
+    Args:
+        image_path: Path to image file
+        max_size: Largest (width, height) in pixels worth embedding; bigger
+            images are downsampled to fit, keeping their aspect ratio
+        
+    Returns:
+        Fully decoded PIL image in "L" or "RGB" mode
+    """
+    from PIL import Image as PILImage
+    
+    with PILImage.open(image_path) as img:
+        # Only the first frame of an animated GIF is embedded
+        img.seek(0)
+        decoded = img.convert("L" if _is_grayscale(img) else "RGB")
+        
+    if max_size is not None:
+        decoded.thumbnail(max_size, PILImage.LANCZOS)
+        
+    return decoded
+
+
+def _load_pair(pair: Tuple[str, str, str],
+               max_size: Optional[Tuple[int, int]] = None) -> Tuple[str, Optional['PILImage.Image'], Optional['PILImage.Image']]:
+    """
+    Decode the question and answer GIFs of a single pair.
+    
+    Also used as the pool worker in load_pairs, so it must stay at module
+    level to be picklable.
+    
+    Args:
+        pair: Tuple of (question_id, question_path, answer_path)
+        max_size: Largest (width, height) in pixels worth embedding
+        
+    Returns:
+        Tuple of (question_id, question_image, answer_image); an image is None
+        if it could not be decoded
+    """
+    question_id, question_path, answer_path = pair
+    images = []
+    
+    for image_path in (question_path, answer_path):
+        try:
+            images.append(_decode_image(image_path, max_size))
+        except Exception as e:
+            logger.error(f"    Error decoding {image_path}: {e}")
+            images.append(None)
+            
+    return question_id, images[0], images[1]
+
+
+def _image_flowable(image_path: str, reader: 'ImageReader', width: float, height: float) -> 'Image':
+    """
+    Create an Image flowable that draws already-decoded pixels instead of re-reading the file.
+    
+    Args:
+        image_path: Path the image was loaded from (used for identification only)
+        reader: ImageReader wrapping the decoded pixels
+        width: Display width in points
+        height: Display height in points
+        
+    Returns:
+        Image flowable backed by the given pixels
+    """
+    from reportlab.platypus import Image
+    
+    flowable = Image(image_path, width=width, height=height)
+    flowable._img = reader
+    return flowable
+
 
 class WebPageToPDFConverter:
     """Converts web pages to PDFs with embedded GIF questions and answers."""
@@ -49,6 +156,16 @@ class WebPageToPDFConverter:
         Args:
             questions_folder: Path to folder containing GIF files
         """
+        from reportlab import rl_config
+        from reportlab.lib import colors
+        from reportlab.lib.pagesizes import A4
+        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+        from reportlab.lib.units import cm
+        
+        # Embed image streams as plain FlateDecode data. ReportLab's default ASCII85
+        # wrapping re-encodes every compressed image in pure Python and inflates it by 25%.
+        rl_config.useA85 = 0
+        
         self.questions_folder = Path(questions_folder)
         self.output_folder = Path("output_pdfs")
         self.output_folder.mkdir(exist_ok=True)
@@ -59,40 +176,86 @@ class WebPageToPDFConverter:
         self.content_width = self.page_width - 2 * self.margin
         self.content_height = self.page_height - 2 * self.margin
         
-    def get_gif_pairs(self) -> List[Tuple[str, str, str]]:
+        # Page content streams only hold a few text and drawing operators; the
+        # images carry their own Flate compression, so skip the per-page zlib pass
+        self.page_compression = 0
+        
+        # Images are never shown larger than the printable area, so anything
+        # beyond twice that (for HiDPI screens) is downsampled before embedding
+        self.max_image_size = (int(2 * self.content_width), int(2 * self.content_height))
+        
+        # A pair decodes in a few milliseconds, while a pool worker has to start up and
+        # pickle ~1 MB of pixels back per pair, so smaller batches are decoded in-process
+        self.min_parallel_pairs = 64
+        
+        # Paragraph styles, built once and shared by every PDF
+        styles = getSampleStyleSheet()
+        self._normal_style = styles['Normal']
+        self._title_style = ParagraphStyle(
+            'CustomTitle',
+            parent=styles['Heading1'],
+            fontSize=24,
+            spaceAfter=30,
+            alignment=1,  # Center alignment
+            textColor=colors.HexColor('#333333')
+        )
+        
+        self._section_style = ParagraphStyle(
+            'CustomSection',
+            parent=styles['Heading2'],
+            fontSize=18,
+            spaceAfter=20,
+            spaceBefore=30,
+            alignment=1,  # Center alignment
+            textColor=colors.HexColor('#555555')
+        )
+        
+        self._id_style = ParagraphStyle(
+            'IDStyle',
+            parent=styles['Normal'],
+            fontSize=14,
+            spaceAfter=20,
+            alignment=1,  # Center alignment
+            textColor=colors.HexColor('#666666')
+        )
+        
+    def get_gif_pairs(self) -> Iterator[Tuple[str, str, str]]:
         """
         Get all question-answer GIF pairs from the folder.
         
-        Returns:
-            List of tuples (question_id, question_path, answer_path)
+        The folder is listed with a single scandir pass, so no per-file stat
+        calls are needed to find the matching answer GIFs.
+        
+        Yields:
+            Tuples (question_id, question_path, answer_path), ordered by numeric question ID
         """
         if not self.questions_folder.exists():
-            print(f"Error: Questions folder '{self.questions_folder}' not found!")
-            return []
+            logger.error(f"Error: Questions folder '{self.questions_folder}' not found!")
+            return
+            
+        # Match the extension and answer names case-insensitively, like glob() on Windows,
+        # so 1234.GIF and 1234s.GIF pair up; keyed by lowercased name
+        with os.scandir(self.questions_folder) as entries:
+            names = {entry.name.lower(): entry.name for entry in entries if entry.name.lower().endswith('.gif')}
             
-        gif_pairs = []
+        # Skip answer GIFs (those ending with 's')
+        question_ids = [name[:-4] for name in names.values() if not name[:-4].lower().endswith('s')]
         
-        # Find all question GIFs (those without 's' suffix)
-        question_gifs = list(self.questions_folder.glob("*.gif"))
+        # Numeric IDs in numeric order, then any non-numeric IDs by name
+        question_ids.sort(key=lambda qid: (not qid.isdigit(), int(qid) if qid.isdigit() else 0, qid))
         
-        for question_gif in question_gifs:
-            filename = question_gif.stem
-            
-            # Skip answer GIFs (those ending with 's')
-            if filename.endswith('s'):
-                continue
-                
+        for filename in question_ids:
             # Look for corresponding answer GIF
-            answer_gif = self.questions_folder / f"{filename}s.gif"
+            question_name = names[f"{filename}.gif".lower()]
+            answer_name = names.get(f"{filename}s.gif".lower())
             
-            if answer_gif.exists():
-                gif_pairs.append((filename, str(question_gif), str(answer_gif)))
+            if answer_name is not None:
+                yield filename, str(self.questions_folder / question_name), str(self.questions_folder / answer_name)
             else:
-                print(f"Warning: No answer found for question {filename}")
+                logger.warning(f"Warning: No answer found for question {filename}")
                 
-        return sorted(gif_pairs)
-    
-    def get_image_dimensions(self, image_path: str, max_width: float = None, max_height: float = None) -> Tuple[float, float]:
+    def get_image_dimensions(self, image_path: str, max_width: float = None, max_height: float = None,
+                             image_size: Optional[Tuple[int, int]] = None) -> Tuple[float, float]:
         """
         Get optimal dimensions for image while maintaining aspect ratio.
         
@@ -100,42 +263,122 @@ class WebPageToPDFConverter:
             image_path: Path to image file
             max_width: Maximum width in points
             max_height: Maximum height in points
+            image_size: Pixel size of the image if already known; avoids re-opening the file
             
         Returns:
             Tuple of (width, height) in points
         """
+        from PIL import Image as PILImage
+        from reportlab.lib.units import cm
+        
         if max_width is None:
             max_width = self.content_width - 2 * cm
         if max_height is None:
             max_height = (self.content_height - 4 * cm) / 2  # Half page minus margins
             
         try:
-            with PILImage.open(image_path) as img:
-                img_width, img_height = img.size
-                aspect_ratio = img_width / img_height
-                
-                # Calculate dimensions that fit within constraints
-                if img_width > img_height:
-                    # Landscape orientation
-                    width = min(max_width, img_width)
-                    height = width / aspect_ratio
-                    if height > max_height:
-                        height = max_height
-                        width = height * aspect_ratio
-                else:
-                    # Portrait orientation
-                    height = min(max_height, img_height)
-                    width = height * aspect_ratio
-                    if width > max_width:
-                        width = max_width
-                        height = width / aspect_ratio
-                        
-                return width, height
-                
+            if image_size is None:
+                with PILImage.open(image_path) as img:
+                    image_size = img.size
+                    
+            img_width, img_height = image_size
+            
+            # Largest scale that fits within constraints without enlarging the image
+            scale = min(1.0, max_width / img_width, max_height / img_height)
+            
+            return img_width * scale, img_height * scale
+            
         except Exception as e:
-            print(f"Error getting image dimensions for {image_path}: {e}")
+            logger.error(f"Error getting image dimensions for {image_path}: {e}")
             return max_width * 0.8, max_height * 0.8
+
+    def load_pairs(self, gif_pairs: List[Tuple[str, str, str]]) -> Iterator[Tuple[str, Optional['PILImage.Image'], Optional['PILImage.Image']]]:
+        """
+        Decode all question-answer pairs, in parallel for large batches, preserving their order.
+        
+        Only the GIF decoding runs in the pool; Flate compression still happens
+        serially while the PDF is built. The combined creators collect every
+        result before building, so all decoded pixels are held in memory at once.
+        
+        Args:
+            gif_pairs: List of (question_id, question_path, answer_path) tuples
+        
+        Yields:
+            Tuples of (question_id, question_image, answer_image) in the same order as gif_pairs
+        """
+        cpu_count = os.cpu_count() or 1
+        max_workers = max(1, min(cpu_count, len(gif_pairs)))
+        chunksize = max(1, len(gif_pairs) // (4 * cpu_count))
+        load_pair = partial(_load_pair, max_size=self.max_image_size)
+        
+        # The pool can only be slower with one worker or too few pairs to amortize it
+        if max_workers == 1 or len(gif_pairs) < self.min_parallel_pairs:
+            yield from map(load_pair, gif_pairs)
+            return
+        
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            yield from executor.map(load_pair, gif_pairs, chunksize=chunksize)
     
+    def _pair_flowables(self, question_id: str, question_path: str, answer_path: str,
+                        question_pixels: Optional['PILImage.Image'],
+                        answer_pixels: Optional['PILImage.Image']) -> List:
+        """
+        Build the flowables for one question-answer page.
+        
+        Args:
+            question_id: Question identifier
+            question_path: Path to question GIF
+            answer_path: Path to answer GIF
+            question_pixels: Decoded question image, or None if it could not be loaded
+            answer_pixels: Decoded answer image, or None if it could not be loaded
+            
+        Returns:
+            List of flowables for the page
+        """
+        from reportlab.lib.utils import ImageReader
+        from reportlab.platypus import Paragraph, Spacer
+        
+        content = []
+        
+        # Title and question ID
+        content.append(Paragraph("Question", self._title_style))
+        content.append(Paragraph(f"Question ID: {question_id}", self._id_style))
+        
+        # Question image
+        try:
+            if question_pixels is None:
+                raise ValueError("image could not be decoded")
+            q_width, q_height = self.get_image_dimensions(question_path, image_size=question_pixels.size)
+            question_img = _image_flowable(question_path, ImageReader(question_pixels), width=q_width, height=q_height)
+            question_img.hAlign = 'CENTER'
+            content.append(question_img)
+        except Exception as e:
+            logger.error(f"    Error adding question image: {e}")
+            content.append(Paragraph(f"[Question image could not be loaded: {question_path}]", self._normal_style))
+        
+        # Spacer between sections
+        content.append(Spacer(1, 40))
+        
+        # Separator line
+        content.append(Paragraph('<para align="center">─────────────────────────────────</para>', self._normal_style))
+        
+        # Answer section
+        content.append(Paragraph("Answer", self._section_style))
+        
+        # Answer image
+        try:
+            if answer_pixels is None:
+                raise ValueError("image could not be decoded")
+            a_width, a_height = self.get_image_dimensions(answer_path, image_size=answer_pixels.size)
+            answer_img = _image_flowable(answer_path, ImageReader(answer_pixels), width=a_width, height=a_height)
+            answer_img.hAlign = 'CENTER'
+            content.append(answer_img)
+        except Exception as e:
+            logger.error(f"    Error adding answer image: {e}")
+            content.append(Paragraph(f"[Answer image could not be loaded: {answer_path}]", self._normal_style))
+            
+        return content
+        
     def create_pdf_with_gifs(self, question_path: str, answer_path: str, 
                            question_id: str, output_path: str) -> bool:
         """
@@ -150,90 +393,33 @@ class WebPageToPDFConverter:
         Returns:
             True if successful, False otherwise
         """
+        from reportlab.platypus import SimpleDocTemplate
+        
         try:
             # Create PDF document
+            buffer = io.BytesIO()
             doc = SimpleDocTemplate(
-                output_path,
-                pagesize=A4,
+                buffer,
+                pagesize=(self.page_width, self.page_height),
                 rightMargin=self.margin,
                 leftMargin=self.margin,
                 topMargin=self.margin,
-                bottomMargin=self.margin
-            )
-            
-            # Create styles
-            styles = getSampleStyleSheet()
-            title_style = ParagraphStyle(
-                'CustomTitle',
-                parent=styles['Heading1'],
-                fontSize=24,
-                spaceAfter=30,
-                alignment=1,  # Center alignment
-                textColor=colors.HexColor('#333333')
-            )
-            
-            section_style = ParagraphStyle(
-                'CustomSection',
-                parent=styles['Heading2'],
-                fontSize=18,
-                spaceAfter=20,
-                spaceBefore=30,
-                alignment=1,  # Center alignment
-                textColor=colors.HexColor('#555555')
-            )
-            
-            id_style = ParagraphStyle(
-                'IDStyle',
-                parent=styles['Normal'],
-                fontSize=14,
-                spaceAfter=20,
-                alignment=1,  # Center alignment
-                textColor=colors.HexColor('#666666')
+                bottomMargin=self.margin,
+                pageCompression=self.page_compression
             )
             
             # Build content
-            content = []
-            
-            # Title and question ID
-            content.append(Paragraph("Question", title_style))
-            content.append(Paragraph(f"Question ID: {question_id}", id_style))
-            
-            # Question image
-            try:
-                q_width, q_height = self.get_image_dimensions(question_path)
-                question_img = Image(question_path, width=q_width, height=q_height)
-                question_img.hAlign = 'CENTER'
-                content.append(question_img)
-            except Exception as e:
-                print(f"Error adding question image: {e}")
-                content.append(Paragraph(f"[Question image could not be loaded: {question_path}]", styles['Normal']))
-            
-            # Spacer between sections
-            content.append(Spacer(1, 40))
-            
-            # Separator line
-            content.append(Paragraph('<para align="center">─────────────────────────────────</para>', styles['Normal']))
-            
-            # Answer section
-            content.append(Paragraph("Answer", section_style))
-            
-            # Answer image
-            try:
-                a_width, a_height = self.get_image_dimensions(answer_path)
-                answer_img = Image(answer_path, width=a_width, height=a_height)
-                answer_img.hAlign = 'CENTER'
-                content.append(answer_img)
-            except Exception as e:
-                print(f"Error adding answer image: {e}")
-                content.append(Paragraph(f"[Answer image could not be loaded: {answer_path}]", styles['Normal']))
+            _, question_pixels, answer_pixels = _load_pair((question_id, question_path, answer_path), self.max_image_size)
+            content = self._pair_flowables(question_id, question_path, answer_path, question_pixels, answer_pixels)
             
             # Build PDF
             doc.build(content)
-            print(f"✓ Created PDF: {output_path}")
+            Path(output_path).write_bytes(buffer.getvalue())
+            logger.info(f"✓ Created PDF: {output_path}")
             return True
             
         except Exception as e:
-            print(f"Error creating PDF {output_path}: {e}")
+            logger.error(f"Error creating PDF {output_path}: {e}")
             return False
     
     def create_simple_pdf(self, question_path: str, answer_path: str, 
@@ -250,36 +436,46 @@ class WebPageToPDFConverter:
         Returns:
             True if successful, False otherwise
         """
+        from reportlab.lib.units import cm
+        from reportlab.lib.utils import ImageReader
+        from reportlab.pdfgen import canvas
+        
         try:
-            c = canvas.Canvas(output_path, pagesize=A4)
-            width, height = A4
+            buffer = io.BytesIO()
+            width, height = self.page_width, self.page_height
+            c = canvas.Canvas(buffer, pagesize=(width, height), pageCompression=self.page_compression)
+            
+            _, question_pixels, answer_pixels = _load_pair((question_id, question_path, answer_path), self.max_image_size)
             
             # Title
             c.setFont("Helvetica-Bold", 24)
-            c.drawCentredText(width/2, height - 80, "Question")
+            c.drawCentredString(width/2, height - 80, "Question")
             
             # Question ID
             c.setFont("Helvetica", 14)
-            c.drawCentredText(width/2, height - 110, f"Question ID: {question_id}")
+            c.drawCentredString(width/2, height - 110, f"Question ID: {question_id}")
             
             # Question image
             try:
+                if question_pixels is None:
+                    raise ValueError("image could not be decoded")
                 q_width, q_height = self.get_image_dimensions(
                     question_path, 
                     max_width=width - 4*cm,
-                    max_height=(height - 200) / 2.2
+                    max_height=(height - 200) / 2.2,
+                    image_size=question_pixels.size
                 )
                 
                 q_x = (width - q_width) / 2
                 q_y = height - 150 - q_height
                 
-                c.drawImage(question_path, q_x, q_y, width=q_width, height=q_height)
+                c.drawImage(ImageReader(question_pixels), q_x, q_y, width=q_width, height=q_height)
                 
                 # Answer section - positioned below question image
                 answer_y_start = q_y - 80
                 
             except Exception as e:
-                print(f"Error with question image: {e}")
+                logger.error(f"Error with question image: {e}")
                 answer_y_start = height / 2
             
             # Separator line
@@ -288,32 +484,36 @@ class WebPageToPDFConverter:
             
             # Answer title
             c.setFont("Helvetica-Bold", 18)
-            c.drawCentredText(width/2, answer_y_start, "Answer")
+            c.drawCentredString(width/2, answer_y_start, "Answer")
             
             # Answer image
             try:
+                if answer_pixels is None:
+                    raise ValueError("image could not be decoded")
                 a_width, a_height = self.get_image_dimensions(
                     answer_path,
                     max_width=width - 4*cm,
-                    max_height=answer_y_start - 100
+                    max_height=answer_y_start - 100,
+                    image_size=answer_pixels.size
                 )
                 
                 a_x = (width - a_width) / 2
                 a_y = answer_y_start - 40 - a_height
                 
-                c.drawImage(answer_path, a_x, a_y, width=a_width, height=a_height)
+                c.drawImage(ImageReader(answer_pixels), a_x, a_y, width=a_width, height=a_height)
                 
             except Exception as e:
-                print(f"Error with answer image: {e}")
+                logger.error(f"Error with answer image: {e}")
                 c.setFont("Helvetica", 12)
-                c.drawCentredText(width/2, answer_y_start - 60, f"[Answer image error: {str(e)}]")
+                c.drawCentredString(width/2, answer_y_start - 60, f"[Answer image error: {str(e)}]")
             
             c.save()
-            print(f"✓ Created PDF: {output_path}")
+            Path(output_path).write_bytes(buffer.getvalue())
+            logger.info(f"✓ Created PDF: {output_path}")
             return True
             
         except Exception as e:
-            print(f"Error creating simple PDF {output_path}: {e}")
+            logger.error(f"Error creating simple PDF {output_path}: {e}")
             return False
     
     def create_combined_pdf_with_gifs(self, gif_pairs: List[Tuple[str, str, str]], output_path: str) -> bool:
@@ -327,85 +527,31 @@ class WebPageToPDFConverter:
         Returns:
             True if successful, False otherwise
         """
+        from reportlab.platypus import PageBreak, SimpleDocTemplate
+        
         try:
             # Create PDF document
+            buffer = io.BytesIO()
             doc = SimpleDocTemplate(
-                output_path,
-                pagesize=A4,
+                buffer,
+                pagesize=(self.page_width, self.page_height),
                 rightMargin=self.margin,
                 leftMargin=self.margin,
                 topMargin=self.margin,
-                bottomMargin=self.margin
-            )
-            
-            # Create styles
-            styles = getSampleStyleSheet()
-            title_style = ParagraphStyle(
-                'CustomTitle',
-                parent=styles['Heading1'],
-                fontSize=24,
-                spaceAfter=30,
-                alignment=1,  # Center alignment
-                textColor=colors.HexColor('#333333')
-            )
-            
-            section_style = ParagraphStyle(
-                'CustomSection',
-                parent=styles['Heading2'],
-                fontSize=18,
-                spaceAfter=20,
-                spaceBefore=30,
-                alignment=1,  # Center alignment
-                textColor=colors.HexColor('#555555')
-            )
-            
-            id_style = ParagraphStyle(
-                'IDStyle',
-                parent=styles['Normal'],
-                fontSize=14,
-                spaceAfter=20,
-                alignment=1,  # Center alignment
-                textColor=colors.HexColor('#666666')
+                bottomMargin=self.margin,
+                pageCompression=self.page_compression
             )
             
             # Build content
             content = []
             
-            for i, (question_id, question_path, answer_path) in enumerate(gif_pairs):
-                print(f"  Adding question {question_id} to combined PDF...")
-                
-                # Title and question ID
-                content.append(Paragraph("Question", title_style))
-                content.append(Paragraph(f"Question ID: {question_id}", id_style))
-                
-                # Question image
-                try:
-                    q_width, q_height = self.get_image_dimensions(question_path)
-                    question_img = Image(question_path, width=q_width, height=q_height)
-                    question_img.hAlign = 'CENTER'
-                    content.append(question_img)
-                except Exception as e:
-                    print(f"    Error adding question image: {e}")
-                    content.append(Paragraph(f"[Question image could not be loaded: {question_path}]", styles['Normal']))
-                
-                # Spacer between sections
-                content.append(Spacer(1, 40))
-                
-                # Separator line
-                content.append(Paragraph('<para align="center">─────────────────────────────────</para>', styles['Normal']))
+            # Collect every pair up front so the worker pool has shut down before the PDF is built
+            loaded_pairs = zip(gif_pairs, list(self.load_pairs(gif_pairs)))
+            
+            for i, ((question_id, question_path, answer_path), (_, question_pixels, answer_pixels)) in enumerate(loaded_pairs):
+                logger.info(f"  Adding question {question_id} to combined PDF...")
                 
-                # Answer section
-                content.append(Paragraph("Answer", section_style))
-                
-                # Answer image
-                try:
-                    a_width, a_height = self.get_image_dimensions(answer_path)
-                    answer_img = Image(answer_path, width=a_width, height=a_height)
-                    answer_img.hAlign = 'CENTER'
-                    content.append(answer_img)
-                except Exception as e:
-                    print(f"    Error adding answer image: {e}")
-                    content.append(Paragraph(f"[Answer image could not be loaded: {answer_path}]", styles['Normal']))
+                content.extend(self._pair_flowables(question_id, question_path, answer_path, question_pixels, answer_pixels))
                 
                 # Add page break between questions (except for the last one)
                 if i < len(gif_pairs) - 1:
@@ -413,11 +559,12 @@ class WebPageToPDFConverter:
             
             # Build PDF
             doc.build(content)
-            print(f"✓ Created combined PDF: {output_path}")
+            Path(output_path).write_bytes(buffer.getvalue())
+            logger.info(f"✓ Created combined PDF: {output_path}")
             return True
             
         except Exception as e:
-            print(f"Error creating combined PDF {output_path}: {e}")
+            logger.error(f"Error creating combined PDF {output_path}: {e}")
             return False
     
     def create_combined_simple_pdf(self, gif_pairs: List[Tuple[str, str, str]], output_path: str) -> bool:
@@ -431,39 +578,50 @@ class WebPageToPDFConverter:
         Returns:
             True if successful, False otherwise
         """
+        from reportlab.lib.units import cm
+        from reportlab.lib.utils import ImageReader
+        from reportlab.pdfgen import canvas
+        
         try:
-            c = canvas.Canvas(output_path, pagesize=A4)
-            width, height = A4
+            buffer = io.BytesIO()
+            width, height = self.page_width, self.page_height
+            c = canvas.Canvas(buffer, pagesize=(width, height), pageCompression=self.page_compression)
+            
+            # Collect every pair up front so the worker pool has shut down before the PDF is built
+            loaded_pairs = zip(gif_pairs, list(self.load_pairs(gif_pairs)))
             
-            for i, (question_id, question_path, answer_path) in enumerate(gif_pairs):
-                print(f"  Adding question {question_id} to combined PDF...")
+            for i, ((question_id, question_path, answer_path), (_, question_pixels, answer_pixels)) in enumerate(loaded_pairs):
+                logger.info(f"  Adding question {question_id} to combined PDF...")
                 
                 # Title
                 c.setFont("Helvetica-Bold", 24)
-                c.drawCentredText(width/2, height - 80, "Question")
+                c.drawCentredString(width/2, height - 80, "Question")
                 
                 # Question ID
                 c.setFont("Helvetica", 14)
-                c.drawCentredText(width/2, height - 110, f"Question ID: {question_id}")
+                c.drawCentredString(width/2, height - 110, f"Question ID: {question_id}")
                 
                 # Question image
                 try:
+                    if question_pixels is None:
+                        raise ValueError("image could not be decoded")
                     q_width, q_height = self.get_image_dimensions(
                         question_path, 
                         max_width=width - 4*cm,
-                        max_height=(height - 200) / 2.2
+                        max_height=(height - 200) / 2.2,
+                        image_size=question_pixels.size
                     )
                     
                     q_x = (width - q_width) / 2
                     q_y = height - 150 - q_height
                     
-                    c.drawImage(question_path, q_x, q_y, width=q_width, height=q_height)
+                    c.drawImage(ImageReader(question_pixels), q_x, q_y, width=q_width, height=q_height)
                     
                     # Answer section - positioned below question image
                     answer_y_start = q_y - 80
                     
                 except Exception as e:
-                    print(f"    Error with question image: {e}")
+                    logger.error(f"    Error with question image: {e}")
                     answer_y_start = height / 2
                 
                 # Separator line
@@ -472,129 +630,219 @@ class WebPageToPDFConverter:
                 
                 # Answer title
                 c.setFont("Helvetica-Bold", 18)
-                c.drawCentredText(width/2, answer_y_start, "Answer")
+                c.drawCentredString(width/2, answer_y_start, "Answer")
                 
                 # Answer image
                 try:
+                    if answer_pixels is None:
+                        raise ValueError("image could not be decoded")
                     a_width, a_height = self.get_image_dimensions(
                         answer_path,
                         max_width=width - 4*cm,
-                        max_height=answer_y_start - 100
+                        max_height=answer_y_start - 100,
+                        image_size=answer_pixels.size
                     )
                     
                     a_x = (width - a_width) / 2
                     a_y = answer_y_start - 40 - a_height
                     
-                    c.drawImage(answer_path, a_x, a_y, width=a_width, height=a_height)
+                    c.drawImage(ImageReader(answer_pixels), a_x, a_y, width=a_width, height=a_height)
                     
                 except Exception as e:
-                    print(f"    Error with answer image: {e}")
+                    logger.error(f"    Error with answer image: {e}")
                     c.setFont("Helvetica", 12)
-                    c.drawCentredText(width/2, answer_y_start - 60, f"[Answer image error: {str(e)}]")
+                    c.drawCentredString(width/2, answer_y_start - 60, f"[Answer image error: {str(e)}]")
                 
                 # Add new page for next question (except for the last one)
                 if i < len(gif_pairs) - 1:
                     c.showPage()
             
             c.save()
-            print(f"✓ Created combined PDF: {output_path}")
+            Path(output_path).write_bytes(buffer.getvalue())
+            logger.info(f"✓ Created combined PDF: {output_path}")
             return True
             
         except Exception as e:
-            print(f"Error creating combined simple PDF {output_path}: {e}")
+            logger.error(f"Error creating combined simple PDF {output_path}: {e}")
             return False
     
-    def process_all_questions(self, use_simple_mode: bool = False) -> None:
+    def get_build_info(self, gif_paths: List[str], use_simple_mode: bool) -> Dict[str, object]:
+        """
+        Describe what an output PDF is built from, for comparison with a later run.
+        
+        Args:
+            gif_paths: GIF paths in the order they appear in the PDF
+            use_simple_mode: If True, the PDF is built with the canvas-based creator
+            
+        Returns:
+            Dictionary with the resolved questions folder, the mode and the resolved GIF paths
+        """
+        return {
+            "questions_folder": str(self.questions_folder.resolve()),
+            "mode": "simple" if use_simple_mode else "standard",
+            "inputs": [str(Path(path).resolve()) for path in gif_paths],
+        }
+        
+    def write_build_info(self, output_path: Path, build_info: Dict[str, object]) -> None:
+        """
+        Record what an output PDF was built from in a JSON file next to it.
+        
+        Args:
+            output_path: Output PDF file path
+            build_info: Result of get_build_info for the PDF
+        """
+        output_path.with_suffix(".json").write_text(json.dumps(build_info, indent=2), encoding="utf-8")
+        
+    def is_up_to_date(self, output_path: Path, input_paths: List[str], build_info: Dict[str, object]) -> bool:
+        """
+        Check whether an output PDF was built from the same inputs and is newer than all of them.
+        
+        Args:
+            output_path: Output PDF file path
+            input_paths: Paths of the files the PDF is built from
+            build_info: Result of get_build_info for the PDF about to be built
+            
+        Returns:
+            True if the output exists, its recorded build info matches and no input
+            has changed since it was written
+        """
+        if not output_path.exists():
+            return False
+            
+        # PDFs from another folder, mode or set of GIFs share the same file name
+        try:
+            recorded = json.loads(output_path.with_suffix(".json").read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return False
+            
+        if recorded != build_info:
+            return False
+            
+        output_mtime = output_path.stat().st_mtime
+        return all(os.stat(path).st_mtime < output_mtime for path in input_paths)
+        
+    def process_all_questions(self, use_simple_mode: bool = False, force: bool = False) -> None:
         """
         Process all question-answer pairs and create a single combined PDF.
         
         Args:
             use_simple_mode: If True, use simple canvas-based PDF creation
+            force: If True, rebuild the PDF even if it is already up to date
         """
-        gif_pairs = self.get_gif_pairs()
+        # Pairs already come back sorted by question ID numerically
+        gif_pairs = list(self.get_gif_pairs())
         
         if not gif_pairs:
-            print("No question-answer pairs found!")
+            logger.warning("No question-answer pairs found!")
             return
-            
-        # Sort by question ID numerically
-        gif_pairs.sort(key=lambda x: int(x[0]) if x[0].isdigit() else float('inf'))
         
-        print(f"Found {len(gif_pairs)} question-answer pairs")
-        print("Creating single combined PDF with all questions in order...")
+        logger.info(f"Found {len(gif_pairs)} question-answer pairs")
+        logger.info("Creating single combined PDF with all questions in order...")
         
         output_path = self.output_folder / "all_questions_combined.pdf"
         
+        gif_paths = [path for _, question_path, answer_path in gif_pairs for path in (question_path, answer_path)]
+        build_info = self.get_build_info(gif_paths, use_simple_mode)
+        
+        # The folder's own mtime changes whenever a GIF is added, removed or renamed
+        if not force and self.is_up_to_date(output_path, [str(self.questions_folder)] + gif_paths, build_info):
+            logger.info(f"Combined PDF is up to date, skipping (use --force to rebuild): {output_path}")
+            return
+        
         if use_simple_mode:
             success = self.create_combined_simple_pdf(gif_pairs, str(output_path))
         else:
             success = self.create_combined_pdf_with_gifs(gif_pairs, str(output_path))
-            if not success:
-                print("  Retrying with simple mode...")
-                success = self.create_combined_simple_pdf(gif_pairs, str(output_path))
         
         if success:
-            print(f"\n{'='*50}")
-            print(f"Conversion complete!")
-            print(f"Successfully created combined PDF with {len(gif_pairs)} questions")
-            print(f"Output file: {output_path.absolute()}")
+            self.write_build_info(output_path, build_info)
+            logger.info(f"\n{'='*50}")
+            logger.info(f"Conversion complete!")
+            logger.info(f"Successfully created combined PDF with {len(gif_pairs)} questions")
+            logger.info(f"Output file: {output_path.absolute()}")
         else:
-            print(f"\n{'='*50}")
-            print("Failed to create combined PDF")
+            logger.info(f"\n{'='*50}")
+            logger.error("Failed to create combined PDF")
     
-    def process_single_question(self, question_id: str, use_simple_mode: bool = False) -> bool:
+    def process_single_question(self, question_id: str, use_simple_mode: bool = False, force: bool = False) -> bool:
         """
         Process a single question-answer pair.
         
         Args:
             question_id: The question identifier (e.g., "1234")
             use_simple_mode: If True, use simple canvas-based PDF creation
+            force: If True, rebuild the PDF even if it is already up to date
             
         Returns:
-            True if successful, False otherwise
+            True if the PDF was created or is already up to date, False otherwise
         """
         question_path = self.questions_folder / f"{question_id}.gif"
         answer_path = self.questions_folder / f"{question_id}s.gif"
         
         if not question_path.exists():
-            print(f"Error: Question GIF not found: {question_path}")
+            logger.error(f"Error: Question GIF not found: {question_path}")
             return False
             
         if not answer_path.exists():
-            print(f"Error: Answer GIF not found: {answer_path}")
+            logger.error(f"Error: Answer GIF not found: {answer_path}")
             return False
             
-        print(f"Processing question {question_id}...")
+        logger.info(f"Processing question {question_id}...")
         
         output_path = self.output_folder / f"question_{question_id}.pdf"
         
+        gif_paths = [str(question_path), str(answer_path)]
+        build_info = self.get_build_info(gif_paths, use_simple_mode)
+        
+        if not force and self.is_up_to_date(output_path, gif_paths, build_info):
+            logger.info(f"✓ PDF for question {question_id} is up to date, skipping (use --force to rebuild): {output_path}")
+            return True
+        
         if use_simple_mode:
-            return self.create_simple_pdf(str(question_path), str(answer_path), question_id, str(output_path))
+            success = self.create_simple_pdf(str(question_path), str(answer_path), question_id, str(output_path))
         else:
             success = self.create_pdf_with_gifs(str(question_path), str(answer_path), question_id, str(output_path))
-            if not success:
-                print("  Retrying with simple mode...")
-                success = self.create_simple_pdf(str(question_path), str(answer_path), question_id, str(output_path))
-            return success
+            
+        if success:
+            self.write_build_info(output_path, build_info)
+            logger.info(f"✓ Successfully created PDF for question {question_id}")
+        else:
+            logger.error(f"✗ Failed to create PDF for question {question_id}")
+        return success
 
 
 def main():
     """Main function to run the converter."""
-    print("Web Page to PDF Converter with GIF Support (ReportLab)")
-    print("Creates ONE combined PDF with all questions in ascending order")
-    print("=" * 65)
+    args = sys.argv[1:]
+    
+    # --quiet hides progress messages and keeps warnings and errors
+    quiet = "--quiet" in args
+    if quiet:
+        args.remove("--quiet")
+    logging.basicConfig(
+        level=logging.WARNING if quiet else logging.INFO,
+        format="%(message)s",
+        handlers=[logging.StreamHandler(sys.stdout)]
+    )
+    
+    logger.info("Web Page to PDF Converter with GIF Support (ReportLab)")
+    logger.info("Creates ONE combined PDF with all questions in ascending order")
+    logger.info("=" * 65)
     
     # Check if questions folder exists
     questions_folder = "questions_folder"
     use_simple_mode = False
     
-    args = sys.argv[1:]
-    
     # Parse arguments
     if "--simple" in args:
         use_simple_mode = True
         args.remove("--simple")
-        print("Using simple PDF generation mode")
+        logger.info("Using simple PDF generation mode")
+    
+    force = "--force" in args
+    if force:
+        args.remove("--force")
+        logger.info("Rebuilding PDFs even if they are up to date")
     
     if len(args) > 0:
         questions_folder = args[0]
@@ -603,16 +851,11 @@ def main():
     
     if len(args) > 1:
         # Process single question (keeping this for testing individual questions)
-        question_id = args[1]
-        success = converter.process_single_question(question_id, use_simple_mode)
-        if success:
-            print(f"✓ Successfully created PDF for question {question_id}")
-        else:
-            print(f"✗ Failed to create PDF for question {question_id}")
+        converter.process_single_question(args[1], use_simple_mode, force)
     else:
         # Process ALL questions into ONE combined PDF
-        print("Processing all questions into a single combined PDF...")
-        converter.process_all_questions(use_simple_mode)
+        logger.info("Processing all questions into a single combined PDF...")
+        converter.process_all_questions(use_simple_mode, force)
 
 
 if __name__ == "__main__":